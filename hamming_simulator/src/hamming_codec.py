@@ -1,3 +1,7 @@
+import sys
+from array import array
+from operator import xor
+
 def get_num_hamming_parities(data_length):
     """
     Calculates the number of Hamming parity bits (p_sec) needed for SEC for a given data length (m).
@@ -181,4 +185,67 @@ def check_and_correct_hamming_code(secded_codeword_input):
                  return secded_codeword, "uncorrectable_error", syndrome
         else:  # S!=0, P=0 (overall parity OK)
             # This indicates a double bit error.
-            return secded_codeword, "double_error_detected", -1 # Syndrome value is not the error position here. 
\ No newline at end of file
+            return secded_codeword, "double_error_detected", -1 # Syndrome value is not the error position here. 
+
+
+_ENCODER_TABLES = {} # data_length -> (byte tables, code_length)
+
+def get_hamming_encoder_tables(data_length):
+    """
+    Builds (once per data length) the byte lookup tables used for bulk encoding.
+    The SEC-DED code is linear, so the codeword of a word is the XOR of the codewords
+    of its bytes. One 256-entry table per data byte is built with generate_hamming_code.
+    Returns:
+        - tables (list): tables[k][b] is the codeword (int, MSB = bit position 1) of byte
+          value b placed in the k-th byte from the LSB of the data word.
+        - code_length (int): Length of the SEC-DED codeword in bits.
+    """
+    if data_length not in [8, 16, 32]:
+        raise ValueError("Data length must be 8, 16, or 32 bits.")
+    if data_length in _ENCODER_TABLES:
+        return _ENCODER_TABLES[data_length]
+
+    # Codeword of each single data bit, as an int (data bit 0 is the MSB of the word)
+    unit_codewords = []
+    for data_idx in range(data_length):
+        unit_data = [0] * data_length
+        unit_data[data_idx] = 1
+        unit_codewords.append(int(''.join(map(str, generate_hamming_code(unit_data))), 2))
+    code_length = data_length + get_num_hamming_parities(data_length) + 1
+
+    tables = []
+    for k in range(data_length // 8):
+        table = [0] * 256
+        for bit in range(8):
+            weight = 1 << bit
+            contribution = unit_codewords[data_length - 1 - (8 * k + bit)]
+            for value in range(weight):
+                table[value | weight] = table[value] ^ contribution
+        tables.append(table)
+
+    _ENCODER_TABLES[data_length] = (tables, code_length)
+    return tables, code_length
+
+
+def encode_words(words, data_length):
+    """
+    Encodes many integer data words (MSB = first data bit) at once.
+    words must be an array.array whose item size is data_length / 8 bytes.
+    Each byte plane of the words is looked up in its table and the results are XORed,
+    so the whole batch is processed without a Python-level loop per word.
+    Returns an array.array('Q') of SEC-DED codewords (MSB = bit position 1).
+    """
+    tables, _code_length = get_hamming_encoder_tables(data_length)
+    word_bytes = data_length // 8
+    if words.itemsize != word_bytes:
+        raise ValueError(f"Words must be stored in {word_bytes}-byte array items.")
+
+    if word_bytes > 1 and sys.byteorder != 'little':
+        words = array(words.typecode, words)
+        words.byteswap()
+    raw = words.tobytes() # Little-endian: k-th byte of each word is raw[k::word_bytes]
+
+    codewords = map(tables[0].__getitem__, raw[0::word_bytes])
+    for k in range(1, word_bytes):
+        codewords = map(xor, codewords, map(tables[k].__getitem__, raw[k::word_bytes]))
+    return array('Q', codewords)
@@ -0,0 +1,126 @@
+import sys
+from array import array
+
+# Kelime genişliği (bit) -> aynı boyutta işaretsiz öğe tutan array tip kodu
+WORD_TYPECODES = {
+    8: 'B',
+    16: next(code for code in 'HIL' if array(code).itemsize == 2),
+    32: next(code for code in 'ILQ' if array(code).itemsize == 4),
+}
+
+HEX_RECORD_DATA_BYTES = 16 # Intel HEX çıktısında satır başına veri baytı
+
+# Veri dışı kayıt tipi -> beklenen veri alanı uzunluğu (bayt)
+_HEX_RECORD_PAYLOAD_LENGTHS = {0x01: 0, 0x02: 2, 0x03: 4, 0x04: 2, 0x05: 4}
+
+
+def _check_word_layout(word_bits, byteorder):
+    if word_bits not in WORD_TYPECODES:
+        raise ValueError("Word width must be 8, 16, or 32 bits.")
+    if byteorder not in ('little', 'big'):
+        raise ValueError("Byte order must be 'little' or 'big'.")
+
+
+def words_from_bytes(raw_bytes, word_bits=8, byteorder='little'):
+    """
+    Ham bayt dizisini word_bits genişliğinde işaretsiz tamsayı kelimelere çevirir.
+    Bayt sayısı kelime boyutunun katı olmalıdır.
+    """
+    _check_word_layout(word_bits, byteorder)
+    word_bytes = word_bits // 8
+    if len(raw_bytes) % word_bytes != 0:
+        raise ValueError(f"Image length ({len(raw_bytes)} bytes) is not a multiple of the {word_bits}-bit word size.")
+    words = array(WORD_TYPECODES[word_bits])
+    words.frombytes(raw_bytes)
+    if word_bytes > 1 and byteorder != sys.byteorder:
+        words.byteswap()
+    return words
+
+
+def words_to_bytes(words, word_bits=8, byteorder='little'):
+    """Tamsayı kelimeleri word_bits genişliğinde ham bayt dizisine çevirir."""
+    _check_word_layout(word_bits, byteorder)
+    packed = array(WORD_TYPECODES[word_bits], words)
+    if word_bits > 8 and byteorder != sys.byteorder:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def parse_intel_hex(text):
+    """
+    Intel HEX metnini ayrıştırır.
+    Desteklenen kayıtlar: 00 (veri), 01 (dosya sonu), 02 (genişletilmiş segment adresi),
+    04 (genişletilmiş doğrusal adres); 03 ve 05 (başlangıç adresi) yok sayılır.
+    Döndürür: (bayt_adresi, bytes) çiftlerinin adrese göre sıralı, bitişik parçaları birleştirilmiş listesi.
+    """
+    records = []
+    base_address = 0
+    for line_no, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line:
+            continue
+        if line[0] != ':':
+            raise ValueError(f"Intel HEX line {line_no}: record must start with ':'.")
+        try:
+            record = bytes.fromhex(line[1:])
+        except ValueError:
+            raise ValueError(f"Intel HEX line {line_no}: invalid hex digits.") from None
+        if len(record) < 5 or len(record) != record[0] + 5:
+            raise ValueError(f"Intel HEX line {line_no}: record length mismatch.")
+        if sum(record) & 0xFF:
+            raise ValueError(f"Intel HEX line {line_no}: checksum mismatch.")
+
+        record_type = record[3]
+        payload = record[4:-1]
+        if record_type in _HEX_RECORD_PAYLOAD_LENGTHS and len(payload) != _HEX_RECORD_PAYLOAD_LENGTHS[record_type]:
+            raise ValueError(f"Intel HEX line {line_no}: record type {record_type:02X} must carry {_HEX_RECORD_PAYLOAD_LENGTHS[record_type]} data bytes.")
+        if record_type == 0x00:
+            records.append((base_address + ((record[1] << 8) | record[2]), payload))
+        elif record_type == 0x01:
+            break
+        elif record_type == 0x02:
+            base_address = int.from_bytes(payload, 'big') << 4
+        elif record_type == 0x04:
+            base_address = int.from_bytes(payload, 'big') << 16
+        elif record_type not in (0x03, 0x05):
+            raise ValueError(f"Intel HEX line {line_no}: unsupported record type {record_type:02X}.")
+
+    # Bitişik veri kayıtlarını tek parçada birleştir
+    records.sort(key=lambda rec: rec[0])
+    segments = []
+    for address, payload in records:
+        if segments and segments[-1][0] + len(segments[-1][1]) == address:
+            segments[-1][1].extend(payload)
+        elif segments and segments[-1][0] + len(segments[-1][1]) > address:
+            raise ValueError(f"Intel HEX data overlaps at address 0x{address:08X}.")
+        else:
+            segments.append((address, bytearray(payload)))
+    return [(address, bytes(payload)) for address, payload in segments]
+
+
+def _hex_record(address, record_type, payload):
+    record = bytes((len(payload), (address >> 8) & 0xFF, address & 0xFF, record_type)) + payload
+    return ':' + (record + bytes(((-sum(record)) & 0xFF,))).hex().upper()
+
+
+def build_intel_hex(segments):
+    """
+    (bayt_adresi, bytes) parçalarından Intel HEX metni üretir.
+    64 KB sınırı aşıldığında 04 (genişletilmiş doğrusal adres) kaydı eklenir.
+    """
+    lines = []
+    current_upper = 0
+    for address, payload in segments:
+        offset = 0
+        while offset < len(payload):
+            record_address = address + offset
+            upper = record_address >> 16
+            if upper != current_upper:
+                lines.append(_hex_record(0, 0x04, upper.to_bytes(2, 'big')))
+                current_upper = upper
+            # Bir kayıt 64 KB sınırını geçmemeli
+            chunk_len = min(HEX_RECORD_DATA_BYTES, len(payload) - offset, 0x10000 - (record_address & 0xFFFF))
+            lines.append(_hex_record(record_address & 0xFFFF, 0x00, payload[offset:offset + chunk_len]))
+            offset += chunk_len
+    lines.append(_hex_record(0, 0x01, b''))
+    return '\n'.join(lines) + '\n'
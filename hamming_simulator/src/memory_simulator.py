@@ -1,16 +1,196 @@
+import re
+import sys
+from array import array
+from collections.abc import Sequence
+
+from hamming_codec import encode_words, get_num_hamming_parities
+from memory_image import (
+    WORD_TYPECODES,
+    _check_word_layout,
+    words_from_bytes,
+    words_to_bytes,
+    parse_intel_hex,
+    build_intel_hex
+)
+
 MAX_MEMORY_LOCATIONS = 64 # Örneğin, 64 satırlık bir bellek
 
+_BITS_FROM_CHARS = bytes.maketrans(b'01', b'\x00\x01') # '0'/'1' karakterlerini 0/1 baytlarına çevirir
+_CHARS_FROM_BITS = bytes.maketrans(b'\x00\x01', b'01')
+_BYTE_BITS = [format(value, '08b').encode().translate(_BITS_FROM_CHARS) for value in range(256)] # bayt -> 8 adet 0/1 baytı
+_WORD_TYPECODE = WORD_TYPECODES[32] # Sıkıştırılmış veri kelimeleri (en fazla 32 bit)
+_CODE_TYPECODE = 'Q' # Sıkıştırılmış SEC-DED kod kelimeleri (en fazla 39 bit)
+_CODE_LENGTHS = {bits: bits + get_num_hamming_parities(bits) + 1 for bits in (8, 16, 32)}
+# Veri genişliği -> kod kelimesinin sığdığı en dar array tipi (13 -> 16, 22 -> 32, 39 -> 64 bit)
+_CODE_ITEM_TYPECODES = {8: WORD_TYPECODES[16], 16: WORD_TYPECODES[32], 32: _CODE_TYPECODE}
+_ITER_CHUNK = 4096 # _CellRange üzerinde dolaşırken birlikte biçimlendirilen kelime sayısı
+_FILLED_RUNS = re.compile(rb'[^\x00]+') # Kelime genişliği dizisinde dolu adres blokları
+
+
+def _int_to_bits(value, length):
+    return list(format(value, f'0{length}b').encode().translate(_BITS_FROM_CHARS))
+
+
+def _bits_of_words(words):
+    """Bir array'deki tüm kelimelerin bitlerini (MSB önce, öğe genişliğinde) tek bytes olarak döndürür."""
+    if sys.byteorder == 'little' and words.itemsize > 1:
+        words = array(words.typecode, words)
+        words.byteswap()
+    return b''.join(map(_BYTE_BITS.__getitem__, words.tobytes()))
+
+
+def _bits_to_int(bits):
+    """0/1 listesini tamsayıya çevirir; liste 0/1 dışında değer içeriyorsa ValueError."""
+    raw = bytes(bits)
+    if not raw or raw.translate(None, b'\x00\x01'):
+        raise ValueError("Data words must be non-empty lists of 0s and 1s.")
+    return int(raw.translate(_CHARS_FROM_BITS), 2)
+
+
+def _build_cell(word_bits, data_word, code_word):
+    """Sıkıştırılmış bir kelimeden yeni hücre sözlüğü oluşturur (word_bits 0 ise boş hücre)."""
+    if not word_bits:
+        return {'data': None, 'hamming_code': None, 'original_hamming_code': None, 'error_info': None}
+    code_bits = _int_to_bits(code_word, _CODE_LENGTHS[word_bits])
+    return {
+        'data': _int_to_bits(data_word, word_bits),
+        'hamming_code': code_bits,
+        'original_hamming_code': code_bits[:],
+        'error_info': None
+    }
+
+
+class _MemoryCells:
+    """
+    memory_array için liste benzeri görünüm.
+    İndeks ve dilim erişimi canlı hücre sözlüklerini döndürür (boş adresler dahil);
+    bu sözlükler _cells içinde saklanır, üzerlerinde yapılan değişiklikler belleğe yansır.
+    Üzerinde dolaşma (for döngüsü) ise saklanmamış hücrelerin salt okunur kopyalarını verir.
+    """
+    def __init__(self, memory):
+        self._memory = memory
+
+    def __len__(self):
+        return self._memory.size
+
+    def _check_address(self, address):
+        if address < 0:
+            address += self._memory.size
+        if not (0 <= address < self._memory.size):
+            raise IndexError("memory address out of range")
+        return address
+
+    def __getitem__(self, address):
+        if isinstance(address, slice):
+            return [self._memory._get_cell(i) for i in range(*address.indices(self._memory.size))]
+        return self._memory._get_cell(self._check_address(address))
+
+    def __setitem__(self, address, cell):
+        self._memory._cells[self._check_address(address)] = cell
+
+    def __iter__(self):
+        memory = self._memory
+        for address, cell in enumerate(memory.read_many(range(memory.size))):
+            if cell is None: # Boş adres: varsa saklanan sözlük, yoksa yeni boş hücre
+                cell = memory._cells.get(address) or _build_cell(0, 0, 0)
+            yield cell
+
+
+class _CellRange(Sequence):
+    """
+    read_many ve get_memory_snapshot sonucu: adreslerin tek geçişte alınmış kopyası.
+    Sıkıştırılmış kelimelerden hücre sözlüğü yalnızca o elemana erişildiğinde oluşturulur
+    ve belleğe geri bağlanmaz; boş veya geçersiz adresler için eleman None'dır.
+    """
+    def __init__(self, word_bits, data_words, code_words, cells):
+        self._word_bits = word_bits # Eleman başına veri genişliği, 0 = boş/geçersiz
+        self._data_words = data_words
+        self._code_words = code_words
+        self._cells = cells # eleman indeksi -> sözlüğe dönüştürülmüş hücre
+
+    def __len__(self):
+        return len(self._word_bits)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not (0 <= index < len(self)):
+            raise IndexError("cell index out of range")
+        cell = self._cells.get(index)
+        if cell is None:
+            if not self._word_bits[index]:
+                return None
+            return _build_cell(self._word_bits[index], self._data_words[index], self._code_words[index])
+        return cell if cell['data'] is not None else None
+
+    def __iter__(self):
+        # Aynı genişlikteki bloklar topluca biçimlendirilir; sözlüğe dönüştürülmüş hücreler olduğu gibi verilir
+        cached = bytearray(len(self))
+        for index in self._cells:
+            cached[index] = 1
+        for start in range(0, len(self), _ITER_CHUNK):
+            end = min(start + _ITER_CHUNK, len(self))
+            word_bits = self._word_bits[start]
+            if not word_bits or self._word_bits.count(word_bits, start, end) != end - start:
+                for index in range(start, end):
+                    yield self[index]
+                continue
+            code_length = _CODE_LENGTHS[word_bits]
+            # Kelimeler önce sığdıkları en dar array tipine çevrilir, böylece gereksiz dolgu bitleri açılmaz
+            data_words = array(WORD_TYPECODES[word_bits], self._data_words[start:end])
+            code_words = array(_CODE_ITEM_TYPECODES[word_bits], self._code_words[start:end])
+            data_bits = list(_bits_of_words(data_words))
+            code_bits = list(_bits_of_words(code_words))
+            data_step = 8 * data_words.itemsize
+            code_step = 8 * code_words.itemsize
+            # Her kelime kendi öğe genişliğinde sağa yaslıdır; anlamlı bitler öğenin sonundadır
+            has_cached = cached.find(1, start, end) != -1
+            for index, data_end, code_end in zip(range(start, end), range(data_step, len(data_bits) + 1, data_step), range(code_step, len(code_bits) + 1, code_step)):
+                if has_cached and cached[index]:
+                    yield self[index]
+                    continue
+                yield {
+                    'data': data_bits[data_end - word_bits:data_end],
+                    'hamming_code': code_bits[code_end - code_length:code_end],
+                    'original_hamming_code': code_bits[code_end - code_length:code_end],
+                    'error_info': None
+                }
+
+    def __eq__(self, other):
+        if isinstance(other, (list, _CellRange)):
+            return list(self) == list(other)
+        return NotImplemented
+
+
 class MemorySimulator:
     def __init__(self, size=MAX_MEMORY_LOCATIONS):
         self.size = size
-        # Bellek, her biri bir sözlük olan bir liste olarak temsil edilecek
-        # Her sözlük şunları içerebilir: {'data': bit_list, 'hamming_code': bit_list, 'has_error': bool}
-        self.memory_array = [None] * size
+        # Bellek, her biri bir sözlük olan bir liste gibi görünür (memory_array)
+        # Her sözlük şunları içerebilir: {'data': bit_list, 'hamming_code': bit_list, 'original_hamming_code': bit_list, 'error_info': str}
+        # Toplu yazılan kelimeler sıkıştırılmış dizilerde tutulur; sözlükler erişildikçe _cells içinde oluşturulur.
+        self.memory_array = _MemoryCells(self)
         self.initialize_memory()
 
     def initialize_memory(self):
-        """Belleği boşaltır (None ile doldurur)."""
-        self.memory_array = [{'data': None, 'hamming_code': None, 'original_hamming_code': None, 'error_info': None} for _ in range(self.size)]
+        """Belleği boşaltır."""
+        self._word_bits = bytearray(self.size) # Adres başına veri genişliği, 0 = boş
+        self._data_words = array(_WORD_TYPECODE, bytes(self.size * array(_WORD_TYPECODE).itemsize))
+        self._code_words = array(_CODE_TYPECODE, bytes(self.size * array(_CODE_TYPECODE).itemsize))
+        self._cells = {} # adres -> hücre sözlüğü (okunan, tek tek yazılan veya hata eklenen adresler)
+
+    def _get_cell(self, address, cache=True):
+        """
+        Adresteki hücre sözlüğünü döndürür; gerekirse sıkıştırılmış depodan oluşturur.
+        cache=True ise oluşturulan sözlük saklanır (değiştirilecek hücreler için).
+        """
+        cell = self._cells.get(address)
+        if cell is None:
+            cell = _build_cell(self._word_bits[address], self._data_words[address], self._code_words[address])
+            if cache:
+                self._cells[address] = cell
+        return cell
 
     def write_to_memory(self, address, data_bits, hamming_code_bits):
         """
@@ -32,13 +212,16 @@ class MemorySimulator:
         """
         Belirli bir adresten saklanan veriyi ve Hamming kodunu okur.
         """
-        if 0 <= address < self.size and self.memory_array[address] and self.memory_array[address]['data'] is not None:
-            return self.memory_array[address]
+        if 0 <= address < self.size:
+            memory_cell = self._get_cell(address, cache=False)
+            if memory_cell['data'] is not None:
+                return memory_cell
         return None # Adres boş veya geçersiz
 
     def get_memory_snapshot(self):
-        """Belleğin mevcut durumunun bir kopyasını döndürür."""
-        return [dict(entry) if entry['data'] is not None else None for entry in self.memory_array]
+        """Belleğin mevcut durumunun bir kopyasını döndürür (boş adresler için None)."""
+        cells = {address: dict(cell) for address, cell in self._cells.items()}
+        return _CellRange(bytes(self._word_bits), self._data_words[:], self._code_words[:], cells)
 
     def introduce_error_at_bit(self, address, bit_position_in_hamming_code):
         """
@@ -77,6 +260,242 @@ class MemorySimulator:
         memory_cell['error_info'] = None
         return True, f"Error cleared at address {address}. Hamming code restored."
 
+    def _store_words(self, start, words, word_bits):
+        """
+        Aynı genişlikteki tamsayı kelimeleri (array) tek geçişte kodlayıp sıkıştırılmış depoya yazar.
+        Aralıktaki eski hücre sözlükleri atılır.
+        """
+        end = start + len(words)
+        self._code_words[start:end] = encode_words(words, word_bits)
+        self._data_words[start:end] = array(_WORD_TYPECODE, words)
+        self._word_bits[start:end] = bytes((word_bits,)) * len(words)
+        for address in [address for address in self._cells if start <= address < end]:
+            del self._cells[address]
+
+    def write_many(self, start, data_words, word_bits=None):
+        """
+        start adresinden başlayarak ardışık adreslere verileri Hamming kodlarıyla birlikte yazar.
+        data_words: Bit listelerinden oluşan bir dizi (8, 16 veya 32 bit).
+        word_bits verilirse data_words bu genişlikte tamsayı (int) kelimeler olarak yorumlanır.
+        Herhangi bir kelime veya aralık geçersizse hiçbir şey yazılmaz.
+        """
+        data_words = list(data_words)
+        if not (0 <= start and start + len(data_words) <= self.size):
+            return False, "Memory range is out of bounds."
+
+        # Ardışık aynı genişlikteki kelimeler tek blok halinde kodlanır
+        blocks = []
+        try:
+            if word_bits is not None:
+                if word_bits not in WORD_TYPECODES:
+                    return False, "Word width must be 8, 16, or 32 bits."
+                blocks.append((start, array(WORD_TYPECODES[word_bits], data_words), word_bits))
+            else:
+                for offset, bits in enumerate(data_words):
+                    length = len(bits)
+                    if length not in WORD_TYPECODES:
+                        return False, f"Data length must be 8, 16, or 32 bits (word {offset})."
+                    value = _bits_to_int(bits)
+                    if blocks and blocks[-1][2] == length:
+                        blocks[-1][1].append(value)
+                    else:
+                        blocks.append((start + offset, array(WORD_TYPECODES[length], [value]), length))
+        except (OverflowError, TypeError, ValueError) as e:
+            return False, f"Invalid data word: {e}"
+
+        for block_start, words, block_bits in blocks:
+            self._store_words(block_start, words, block_bits)
+        return True, f"Wrote {len(data_words)} words at address {start}."
+
+    def read_many(self, addresses):
+        """
+        Verilen adreslerdeki (örn. range(0, 16)) hücreleri tek seferde okur.
+        Sıkıştırılmış depo tek geçişte kopyalanır; hücre sözlükleri elemana erişildikçe oluşturulur.
+        Boş veya geçersiz adresler için listede None bulunur.
+        """
+        if isinstance(addresses, range) and addresses.step > 0 and (
+                not addresses or (0 <= addresses.start and addresses[-1] < self.size)):
+            # Aralık tamamen bellekteyse dizilerden dilim olarak kopyala
+            index = slice(addresses.start, addresses.stop, addresses.step)
+            cells = {
+                addresses.index(address): cell
+                for address, cell in self._cells.items() if address in addresses
+            }
+            return _CellRange(bytes(self._word_bits[index]), self._data_words[index], self._code_words[index], cells)
+
+        addresses = list(addresses)
+        word_bits = bytearray(len(addresses))
+        data_words = array(_WORD_TYPECODE, bytes(len(addresses) * array(_WORD_TYPECODE).itemsize))
+        code_words = array(_CODE_TYPECODE, bytes(len(addresses) * array(_CODE_TYPECODE).itemsize))
+        cells = {}
+        for offset, address in enumerate(addresses):
+            if not isinstance(address, int) or not (0 <= address < self.size):
+                continue # Geçersiz adres: None
+            if address in self._cells:
+                cells[offset] = self._cells[address]
+            else:
+                word_bits[offset] = self._word_bits[address]
+                data_words[offset] = self._data_words[address]
+                code_words[offset] = self._code_words[address]
+        return _CellRange(bytes(word_bits), data_words, code_words, cells)
+
+    def _code_length_at(self, address):
+        """Adresteki Hamming kodunun uzunluğu (hücre oluşturmadan); boşsa None."""
+        cell = self._cells.get(address)
+        if cell is not None:
+            return None if cell['hamming_code'] is None else len(cell['hamming_code'])
+        word_bits = self._word_bits[address]
+        return _CODE_LENGTHS[word_bits] if word_bits else None
+
+    def inject_many(self, addresses, bit_positions):
+        """
+        Birden çok adresteki Hamming kodlarında bit bozar.
+        bit_positions: Tüm adreslere uygulanacak tek bir 1-indeksli pozisyon
+        ya da addresses ile aynı uzunlukta pozisyon dizisi.
+        Herhangi bir adres/pozisyon geçersizse hiçbir bit değiştirilmez.
+        """
+        addresses = list(addresses)
+        if isinstance(bit_positions, int):
+            bit_positions = [bit_positions] * len(addresses)
+        else:
+            bit_positions = list(bit_positions)
+            if len(bit_positions) != len(addresses):
+                return False, "Number of bit positions must match number of addresses."
+
+        # Önce hepsini doğrula, sonra uygula
+        for address, bit_position in zip(addresses, bit_positions):
+            if not (isinstance(address, int) and isinstance(bit_position, int)):
+                return False, "Addresses and bit positions must be integers."
+            if not (0 <= address < self.size):
+                return False, f"Invalid memory address: {address}."
+            code_length = self._code_length_at(address)
+            if code_length is None:
+                return False, f"No data at memory address {address}."
+            if not (1 <= bit_position <= code_length):
+                return False, f"Invalid bit position {bit_position} at address {address}. Must be between 1 and {code_length}."
+
+        for address, bit_position in zip(addresses, bit_positions):
+            memory_cell = self._get_cell(address)
+            hamming_code = memory_cell['hamming_code']
+            hamming_code[bit_position - 1] = 1 - hamming_code[bit_position - 1]
+            memory_cell['error_info'] = f"error_introduced_at_bit_{bit_position}"
+        return True, f"Errors introduced at {len(addresses)} memory locations."
+
+    def _read_words(self, start, count):
+        """
+        [start, start+count) aralığındaki verileri tamsayı dizisi olarak döndürür.
+        Ayrıca adres başına genişlik dizisini (0 = boş) ve aralıktaki ortak kelime genişliğini döndürür.
+        Sözlüğe dönüştürülmüş hücreler sıkıştırılmış değerlerin yerine geçer.
+        """
+        end = start + count
+        words = self._data_words[start:end]
+        widths = self._word_bits[start:end]
+        for address, cell in self._cells.items():
+            if start <= address < end:
+                data_bits = cell['data']
+                if data_bits is None:
+                    words[address - start] = 0
+                    widths[address - start] = 0
+                elif len(data_bits) not in WORD_TYPECODES:
+                    raise ValueError(f"Address {address} holds {len(data_bits)}-bit data; images need 8, 16, or 32 bits.")
+                else:
+                    words[address - start] = _bits_to_int(data_bits)
+                    widths[address - start] = len(data_bits)
+
+        present_widths = set(widths.translate(None, b'\x00'))
+        if len(present_widths) > 1:
+            raise ValueError("Memory range mixes different data lengths; cannot build a single image.")
+        return words, widths, (present_widths.pop() if present_widths else None)
+
+    def _check_range(self, start, count):
+        if count is None:
+            count = self.size - start
+        if not (0 <= start and 0 <= count and start + count <= self.size):
+            raise ValueError("Invalid memory range.")
+        return count
+
+    def import_binary_image(self, path, start=0, word_bits=8, byteorder='little'):
+        """
+        Ham ikili (binary) bellek görüntüsünü dosyadan okuyup start adresinden itibaren belleğe yazar.
+        Her kelime word_bits genişliğindedir ve byteorder bayt sırasıyla saklanır.
+        """
+        try:
+            with open(path, 'rb') as image_file:
+                words = words_from_bytes(image_file.read(), word_bits, byteorder)
+        except (OSError, ValueError) as e:
+            return False, f"Cannot load binary image: {e}"
+        if not (0 <= start and start + len(words) <= self.size):
+            return False, f"Image of {len(words)} words does not fit in memory at address {start}."
+        self._store_words(start, words, word_bits)
+        return True, f"Loaded {len(words)} words at address {start}."
+
+    def export_binary_image(self, path, start=0, count=None, byteorder='little'):
+        """
+        [start, start+count) aralığındaki verileri ham ikili görüntü olarak dosyaya yazar.
+        Boş adresler 0 olarak yazılır. count verilmezse belleğin sonuna kadar yazılır.
+        """
+        try:
+            count = self._check_range(start, count)
+            words, _widths, word_bits = self._read_words(start, count)
+            if word_bits is None:
+                return False, "No data in the selected memory range."
+            image = words_to_bytes(words, word_bits, byteorder)
+            with open(path, 'wb') as image_file:
+                image_file.write(image)
+        except (OSError, ValueError) as e:
+            return False, f"Cannot export binary image: {e}"
+        return True, f"Exported {count} words from address {start}."
+
+    def import_intel_hex(self, path, word_bits=8, byteorder='little'):
+        """
+        Intel HEX bellek görüntüsünü dosyadan okuyup belleğe yazar.
+        HEX adresleri bayt adresidir; kelime adresi = bayt adresi / (word_bits / 8).
+        Görüntünün tamamı belleğe sığmazsa hiçbir şey yazılmaz.
+        """
+        try:
+            _check_word_layout(word_bits, byteorder)
+            with open(path, 'r') as hex_file:
+                segments = parse_intel_hex(hex_file.read())
+            word_bytes = word_bits // 8
+            blocks = []
+            for byte_address, payload in segments:
+                if byte_address % word_bytes != 0:
+                    raise ValueError(f"segment at 0x{byte_address:08X} is not aligned to {word_bits}-bit words.")
+                words = words_from_bytes(payload, word_bits, byteorder)
+                address = byte_address // word_bytes
+                if address + len(words) > self.size:
+                    return False, f"Intel HEX image does not fit in memory (needs address {address + len(words) - 1})."
+                blocks.append((address, words))
+        except (OSError, ValueError) as e:
+            return False, f"Cannot load Intel HEX image: {e}"
+
+        for address, words in blocks:
+            self._store_words(address, words, word_bits)
+        return True, f"Loaded {sum(len(words) for _, words in blocks)} words from Intel HEX image."
+
+    def export_intel_hex(self, path, start=0, count=None, byteorder='little'):
+        """
+        [start, start+count) aralığındaki dolu adresleri Intel HEX görüntüsü olarak dosyaya yazar.
+        Boş adresler görüntüye dahil edilmez.
+        """
+        try:
+            count = self._check_range(start, count)
+            words, widths, word_bits = self._read_words(start, count)
+            if word_bits is None:
+                return False, "No data in the selected memory range."
+
+            # Dolu adreslerden oluşan bitişik blokları bayt parçalarına çevir
+            word_bytes = word_bits // 8
+            segments = []
+            for run in _FILLED_RUNS.finditer(widths):
+                payload = words_to_bytes(words[run.start():run.end()], word_bits, byteorder)
+                segments.append(((start + run.start()) * word_bytes, payload))
+            with open(path, 'w') as hex_file:
+                hex_file.write(build_intel_hex(segments))
+        except (OSError, ValueError) as e:
+            return False, f"Cannot export Intel HEX image: {e}"
+        return True, f"Exported {sum(len(payload) for _, payload in segments) // word_bytes} words as Intel HEX."
+
 # Örnek Kullanım (test için):
 if __name__ == '__main__':
     mem = MemorySimulator(size=16)
@@ -0,0 +1,64 @@
+"""
+1M kelimelik bellek görüntüsü üzerinde toplu işlemlerin süre ölçümü.
+Kullanım: python hamming_simulator/tests/bench_memory_bulk.py [8|16|32 ...]
+Bir saniyeyi aşan işlem olursa sıfırdan farklı çıkış kodu döner.
+"(bilgi)" ile işaretli satırlar her hücre için sözlük oluşturduğundan sınıra tabi değildir.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from memory_simulator import MemorySimulator
+
+WORDS = 1 << 20
+TIME_LIMIT = 1.0 # saniye
+
+
+def bench(word_bits, work_dir):
+    image_path = os.path.join(work_dir, f"image{word_bits}.bin")
+    with open(image_path, 'wb') as image_file:
+        image_file.write(random.randbytes(WORDS * word_bits // 8))
+
+    results = []
+    def timed(label, operation, limited=True):
+        start = time.perf_counter()
+        result = operation()
+        results.append((label, time.perf_counter() - start, limited))
+        if isinstance(result, tuple) and not result[0]:
+            raise RuntimeError(f"{label} failed: {result[1]}")
+        return result
+
+    mem = timed("MemorySimulator()", lambda: MemorySimulator(size=WORDS))
+    timed("import_binary_image", lambda: mem.import_binary_image(image_path, word_bits=word_bits))
+    timed("export_binary_image", lambda: mem.export_binary_image(os.path.join(work_dir, "out.bin")))
+    timed("export_intel_hex", lambda: mem.export_intel_hex(os.path.join(work_dir, "out.hex")))
+    mem2 = MemorySimulator(size=WORDS)
+    timed("import_intel_hex", lambda: mem2.import_intel_hex(os.path.join(work_dir, "out.hex"), word_bits=word_bits))
+    timed("inject_many (1024)", lambda: mem.inject_many(range(0, WORDS, 1024), 1))
+    cells = timed("read_many", lambda: mem.read_many(range(WORDS)))
+    timed("read_many (1000 cells)", lambda: [cells[i]['data'] for i in range(0, WORDS, WORDS // 1000)])
+    timed("get_memory_snapshot", mem.get_memory_snapshot)
+    timed("iterate all cells (bilgi)", lambda: deque(cells, maxlen=0), limited=False)
+    return results
+
+
+def main():
+    widths = [int(arg) for arg in sys.argv[1:]] or [8, 16, 32]
+    slow = False
+    with tempfile.TemporaryDirectory() as work_dir:
+        for word_bits in widths:
+            print(f"{word_bits}-bit, {WORDS} words")
+            for label, seconds, limited in bench(word_bits, work_dir):
+                marker = "  <-- over limit" if limited and seconds >= TIME_LIMIT else ""
+                slow = slow or bool(marker)
+                print(f"  {label:<26}{seconds:7.3f} s{marker}")
+    return 1 if slow else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modüller src/ altında düz (paketsiz) olarak içe aktarılıyor, main.py ile aynı şekilde
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
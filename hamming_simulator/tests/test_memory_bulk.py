@@ -0,0 +1,224 @@
+import random
+from array import array
+
+import pytest
+
+from hamming_codec import generate_hamming_code, check_and_correct_hamming_code, encode_words
+from memory_image import WORD_TYPECODES, parse_intel_hex, build_intel_hex, _hex_record
+from memory_simulator import MemorySimulator
+
+
+def _bits(value, length):
+    return [int(c) for c in format(value, f'0{length}b')]
+
+
+@pytest.mark.parametrize("word_bits", [8, 16, 32])
+def test_encode_words_matches_generate_hamming_code(word_bits):
+    rng = random.Random(word_bits)
+    values = [0, (1 << word_bits) - 1] + [rng.getrandbits(word_bits) for _ in range(500)]
+    codewords = encode_words(array(WORD_TYPECODES[word_bits], values), word_bits)
+    for value, codeword in zip(values, codewords):
+        expected = generate_hamming_code(_bits(value, word_bits))
+        assert _bits(codeword, len(expected)) == expected
+
+
+@pytest.mark.parametrize("word_bits", [8, 16, 32])
+def test_write_many_read_many_cells_match_single_writes(word_bits):
+    rng = random.Random(word_bits)
+    data_words = [_bits(rng.getrandbits(word_bits), word_bits) for _ in range(20)]
+    mem = MemorySimulator(size=32)
+    assert mem.write_many(5, data_words)[0]
+
+    cells = mem.read_many(range(32))
+    assert cells[:5] == [None] * 5 and cells[25:] == [None] * 7
+    for address, (data_bits, cell) in enumerate(zip(data_words, cells[5:25]), 5):
+        assert cell['data'] == data_bits
+        assert cell['hamming_code'] == generate_hamming_code(data_bits)
+        assert cell['original_hamming_code'] == cell['hamming_code']
+        assert cell == mem.read_from_memory(address)
+
+
+def test_reads_do_not_change_memory_but_memory_array_cells_are_live():
+    mem = MemorySimulator(size=8)
+    mem.write_many(0, [0x0F, 0xF0], word_bits=8)
+    snapshot = mem.get_memory_snapshot()
+
+    # Okuma sonuçları kopyadır: değiştirmek belleği etkilemez
+    mem.read_many(range(8))[0]['hamming_code'][0] ^= 1
+    mem.read_from_memory(1)['error_info'] = "x"
+    for cell in mem.memory_array:
+        if cell['data'] is not None:
+            cell['data'][0] ^= 1
+    assert mem.get_memory_snapshot() == snapshot
+
+    # İndeks ve dilim erişimi canlı hücre döndürür, boş adresler dahil
+    mem.memory_array[0]['error_info'] = "marked"
+    mem.memory_array[5]['error_info'] = "empty but marked"
+    assert [cell['error_info'] for cell in mem.memory_array[0:6:5]] == ["marked", "empty but marked"]
+    assert mem.read_from_memory(0)['error_info'] == "marked"
+    assert mem.memory_array[-8] is mem.memory_array[0]
+
+
+def test_read_many_handles_arbitrary_and_invalid_addresses():
+    mem = MemorySimulator(size=8)
+    mem.write_many(2, [7, 8, 9], word_bits=8)
+    mem.inject_many([3], 1)
+    cells = mem.read_many([4, 3, 1.5, -1, 8, 2, "2"])
+    assert [cell and cell['data'] for cell in cells] == [_bits(9, 8), _bits(8, 8), None, None, None, _bits(7, 8), None]
+    assert cells[1]['error_info'] == "error_introduced_at_bit_1"
+    assert mem.read_many(range(6, 10)) == [None, None, None, None]
+    assert mem.read_many(range(4, 1, -1))[0]['data'] == _bits(9, 8)
+
+
+def test_write_many_rejects_invalid_input_without_writing():
+    mem = MemorySimulator(size=8)
+    assert mem.write_many(0, [[1] * 8] * 2)[0]
+    before = mem.get_memory_snapshot()
+
+    assert mem.write_many(7, [[0] * 8] * 2)[0] is False        # aralık dışı
+    assert mem.write_many(0, [[0] * 8, []])[0] is False         # boş bit listesi
+    assert mem.write_many(0, [[0] * 8, [2] * 8])[0] is False    # 0/1 dışı bit
+    assert mem.write_many(0, [[0] * 12])[0] is False            # desteklenmeyen uzunluk
+    assert mem.write_many(0, [256], word_bits=8)[0] is False    # sığmayan değer
+    assert mem.write_many(0, [1], word_bits=12)[0] is False     # desteklenmeyen genişlik
+    assert mem.get_memory_snapshot() == before
+
+
+def test_inject_many_flips_bits_detected_by_checker():
+    mem = MemorySimulator(size=16)
+    mem.write_many(0, range(16), word_bits=8)
+    success, _msg = mem.inject_many(range(8), [1, 2, 3, 4, 5, 6, 7, 13])
+    assert success
+    for address, bit_position in enumerate([1, 2, 3, 4, 5, 6, 7, 13]):
+        _corrected, error_type, error_pos = check_and_correct_hamming_code(mem.read_from_memory(address)['hamming_code'])
+        assert (error_type, error_pos) == ("single_error_corrected", bit_position)
+    assert mem.read_from_memory(8)['error_info'] is None
+
+
+@pytest.mark.parametrize("addresses, bit_positions", [
+    ([0, 1, 99], 3),         # geçersiz adres
+    ([0, 1, 10], 3),         # boş adres
+    ([0, 1, 2], [1, 2, 14]), # geçersiz bit pozisyonu
+    ([0, 1, 2], [1, 2]),     # uzunluk uyuşmazlığı
+])
+def test_inject_many_changes_nothing_when_validation_fails(addresses, bit_positions):
+    mem = MemorySimulator(size=16)
+    mem.write_many(0, range(4), word_bits=8)
+    before = mem.get_memory_snapshot()
+    success, _msg = mem.inject_many(addresses, bit_positions)
+    assert success is False
+    assert mem.get_memory_snapshot() == before
+
+
+@pytest.mark.parametrize("word_bits, byteorder", [(8, 'little'), (16, 'big'), (32, 'little'), (32, 'big')])
+def test_binary_image_round_trip(tmp_path, word_bits, byteorder):
+    raw = random.Random(word_bits).randbytes(4096)
+    (tmp_path / "in.bin").write_bytes(raw)
+    mem = MemorySimulator(size=4096 + 3)
+    assert mem.import_binary_image(tmp_path / "in.bin", start=3, word_bits=word_bits, byteorder=byteorder)[0]
+
+    word_bytes = word_bits // 8
+    first = mem.read_from_memory(3)['data']
+    assert first == _bits(int.from_bytes(raw[:word_bytes], byteorder), word_bits)
+    assert mem.read_from_memory(3)['hamming_code'] == generate_hamming_code(first)
+
+    assert mem.export_binary_image(tmp_path / "out.bin", start=3, count=len(raw) // word_bytes, byteorder=byteorder)[0]
+    assert (tmp_path / "out.bin").read_bytes() == raw
+
+
+def test_binary_export_reflects_single_writes_and_rejects_mixed_widths(tmp_path):
+    mem = MemorySimulator(size=4)
+    mem.write_many(0, [1, 2, 3], word_bits=8)
+    mem.write_to_memory(1, _bits(0xAB, 8), generate_hamming_code(_bits(0xAB, 8)))
+    assert mem.export_binary_image(tmp_path / "out.bin")[0]
+    assert (tmp_path / "out.bin").read_bytes() == bytes([1, 0xAB, 3, 0])
+
+    mem.write_many(3, [_bits(5, 16)])
+    assert mem.export_binary_image(tmp_path / "out.bin")[0] is False
+
+
+@pytest.mark.parametrize("word_bits", [8, 32])
+def test_sparse_intel_hex_round_trip_across_64k_boundary(tmp_path, word_bits):
+    word_bytes = word_bits // 8
+    size = 0x30000 // word_bytes
+    mem = MemorySimulator(size=size)
+    boundary = 0x10000 // word_bytes
+    # İki blok: biri 64 KB sınırını geçiyor, diğeri 128 KB üstünde ve aradaki adresler boş
+    mem.write_many(boundary - 5, range(1, 11), word_bits=word_bits)
+    mem.write_many(2 * boundary + 7, range(20, 23), word_bits=word_bits)
+    assert mem.export_intel_hex(tmp_path / "out.hex")[0]
+
+    text = (tmp_path / "out.hex").read_text()
+    assert ":020000040001F9" in text and ":020000040002F8" in text
+    assert all(len(bytes.fromhex(line[1:])) - 5 <= 16 for line in text.split())
+
+    mem2 = MemorySimulator(size=size)
+    success, msg = mem2.import_intel_hex(tmp_path / "out.hex", word_bits=word_bits)
+    assert success, msg
+    assert [c and c['data'] for c in mem2.read_many(range(size))] == [c and c['data'] for c in mem.read_many(range(size))]
+
+
+def test_build_intel_hex_splits_records_at_64k_boundary():
+    text = build_intel_hex([(0xFFF8, bytes(range(16)))])
+    segments = parse_intel_hex(text)
+    assert segments == [(0xFFF8, bytes(range(16)))]
+    assert text.split() == [
+        _hex_record(0xFFF8, 0x00, bytes(range(8))),
+        _hex_record(0, 0x04, b'\x00\x01'),
+        _hex_record(0, 0x00, bytes(range(8, 16))),
+        ":00000001FF",
+    ]
+
+
+def test_parse_intel_hex_applies_segment_base_and_merges_records():
+    text = "\n".join([
+        _hex_record(0, 0x02, b'\x10\x00'),   # taban 0x10000
+        _hex_record(0x0004, 0x00, b'\x03\x04'),
+        _hex_record(0x0002, 0x00, b'\x01\x02'),
+        _hex_record(0, 0x05, b'\x00\x00\x01\x00'),
+        ":00000001FF",
+        _hex_record(0x0000, 0x00, b'\xEE'),  # dosya sonundan sonra: yok sayılır
+    ])
+    assert parse_intel_hex(text) == [(0x10002, b'\x01\x02\x03\x04')]
+
+
+@pytest.mark.parametrize("line, reason", [
+    (":0100000001FF", "checksum"),
+    (":0200000401", "length"),
+    (_hex_record(0, 0x04, b'\x00'), "must carry 2"),
+    (_hex_record(0, 0x02, b'\x00\x01\x00'), "must carry 2"),
+    (_hex_record(0, 0x03, b'\x00\x00'), "must carry 4"),
+    (_hex_record(0, 0x05, b'\x00\x00\x00\x00\x00'), "must carry 4"),
+    (_hex_record(0, 0x01, b'\x00'), "must carry 0"),
+    (_hex_record(0, 0x07, b''), "unsupported"),
+    ("00000001FF", "start with"),
+])
+def test_parse_intel_hex_rejects_malformed_records(line, reason):
+    with pytest.raises(ValueError, match=reason):
+        parse_intel_hex(line)
+
+
+def test_parse_intel_hex_rejects_overlapping_records():
+    text = "\n".join([_hex_record(0x10, 0x00, b'\x01\x02\x03\x04'), _hex_record(0x12, 0x00, b'\xAA')])
+    with pytest.raises(ValueError, match="overlaps"):
+        parse_intel_hex(text)
+
+
+def test_image_import_errors_are_reported_not_raised(tmp_path):
+    mem = MemorySimulator(size=4)
+    (tmp_path / "odd.bin").write_bytes(b'\x01\x02\x03')
+    (tmp_path / "big.bin").write_bytes(bytes(5))
+    (tmp_path / "bad.hex").write_text(_hex_record(0x01, 0x00, b'\x01\x02') + "\n:00000001FF\n")
+
+    assert mem.import_binary_image(tmp_path / "odd.bin", word_bits=16)[0] is False
+    assert mem.import_binary_image(tmp_path / "big.bin")[0] is False
+    assert mem.import_binary_image(tmp_path / "missing.bin")[0] is False
+    assert mem.import_intel_hex(tmp_path / "bad.hex", word_bits=16)[0] is False
+    assert mem.export_binary_image(tmp_path / "out.bin")[0] is False  # bellek boş
+
+    (tmp_path / "one.hex").write_text(_hex_record(0x01, 0x00, b'\x01') + "\n:00000001FF\n")
+    (tmp_path / "empty.hex").write_text(":00000001FF\n")
+    assert mem.import_intel_hex(tmp_path / "one.hex", word_bits=4)[0] is False
+    assert mem.import_intel_hex(tmp_path / "empty.hex", word_bits=12)[0] is False
+    assert mem.import_intel_hex(tmp_path / "empty.hex", byteorder='middle')[0] is False
+    assert mem.read_many(range(4)) == [None] * 4